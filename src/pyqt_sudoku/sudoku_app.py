@@ -2,6 +2,7 @@
 
 import sys
 
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QApplication
 
 from pyqt_sudoku.sudoku_main_win import SudokuMainWindow
@@ -15,6 +16,8 @@ class SudokuApp(QApplication):
         super().__init__(sys.argv)
         self.main_window = SudokuMainWindow()
         self.main_window.key_esc_pressed.connect(self.quit)
+        # Puzzles still being generated in the background must finish before exiting.
+        self.aboutToQuit.connect(QThreadPool.globalInstance().waitForDone)
 
 
 def launch_app() -> None:
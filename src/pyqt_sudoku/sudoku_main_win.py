@@ -1,53 +1,112 @@
-"""Module containing only the main window for the application."""
+"""Module containing the main window for the application.
+
+The workers generating the puzzles in the background are also defined here.
+"""
 
 from __future__ import annotations
 
+import array
 import contextlib
-import os.path
 import random
-from typing import ClassVar, Iterator, Optional
+from typing import Iterator, Optional
+
+from PyQt6 import QtCore, QtGui, QtWidgets
 
-from PyQt6 import QtCore, QtGui, QtWidgets, uic
-from sudoku import Sudoku
+from pyqt_sudoku.sudoku_solver import generate_puzzle
+from pyqt_sudoku.ui_sudoku_main_win import Ui_MainWindow
 
 # RGB Colors
 BLACK = (0, 0, 0)
 GREEN = (0, 150, 0)
 RED = (255, 0, 0)
 BLUE = (0, 0, 250)
+_QCOLORS = {rgb: QtGui.QColor(*rgb) for rgb in (BLACK, GREEN, RED, BLUE)}
+
+# Format of the cells
+_CELL_ALIGNMENT = QtCore.Qt.AlignmentFlag.AlignCenter
+_CELL_FONT_POINT_SIZE = 15
+
+# Text accepted within a cell.
+_VALID_CELL_TEXT_PATTERN = "[1-9]"
+
+# Ratio of empty cells for each difficulty.
+_DIFFICULTY_LEVELS = {"Easy": 0.3, "Medium": 0.45, "Hard": 0.6}
+
+
+class _PuzzleWorkerSignals(QtCore.QObject):
+    """Signals emitted by the puzzle workers."""
+
+    puzzle_generated = QtCore.pyqtSignal(float, object, object)
+
+
+class _PuzzleWorker(QtCore.QRunnable):
+    """Runnable generating a sudoku puzzle within a thread of the pool."""
+
+    def __init__(self, difficulty_level: float, signals: _PuzzleWorkerSignals) -> None:
+        """Constructor of _PuzzleWorker."""
+        super().__init__()
+        self.difficulty_level = difficulty_level
+        self.signals = signals
+
+    def run(self) -> None:
+        """Generates the puzzle and emits it with its difficulty level."""
+        self.signals.puzzle_generated.emit(
+            self.difficulty_level, *generate_puzzle(self.difficulty_level)
+        )
 
 
 class SudokuMainWindow(QtWidgets.QMainWindow):
     """Class holding the main window of the application."""
 
-    UI_FILE_PATH = os.path.abspath(__file__).replace(".py", ".ui")
-    _VALID_CELL_VALUES: ClassVar[set[str]] = {
-        "1",
-        "2",
-        "3",
-        "4",
-        "5",
-        "6",
-        "7",
-        "8",
-        "9",
-    }
-
     key_esc_pressed = QtCore.pyqtSignal()
 
     def __init__(self) -> None:
         """Constructor of SudokuMainWindow."""
         super().__init__()
-        uic.loadUi(SudokuMainWindow.UI_FILE_PATH, self)
-
-        new_game_button = self.findChild(QtWidgets.QPushButton, "newGameButton")
-        self.hint_button = self.findChild(QtWidgets.QPushButton, "hintButton")
-        self.check_numbers_button = self.findChild(
-            QtWidgets.QPushButton, "checkNumbersButton"
-        )
-        self.difficulty_combobox: QtWidgets.QComboBox = self.findChild(
-            QtWidgets.QComboBox, "difficultyComboBox"
+        # Widgets built by the code compiled from 'sudoku_main_win.ui'.
+        self._ui = Ui_MainWindow()
+        self._ui.setupUi(self)
+
+        self._cells: list[list[QtWidgets.QLineEdit]] = [
+            [getattr(self._ui, f"cell_{row_idx}_{col_idx}") for col_idx in range(9)]
+            for row_idx in range(9)
+        ]
+        # Each cell keeps its own coordinates, as they never change.
+        # The font, alignment and validator (shared by all cells) are set only once.
+        cell_font = QtGui.QFont(self._cells[0][0].font())
+        cell_font.setPointSize(_CELL_FONT_POINT_SIZE)
+        cell_validator = QtGui.QRegularExpressionValidator(
+            QtCore.QRegularExpression(_VALID_CELL_TEXT_PATTERN), self
         )
+        for row_idx, row_cells in enumerate(self._cells):
+            for col_idx, cell in enumerate(row_cells):
+                cell.row_idx, cell.col_idx = row_idx, col_idx
+                cell.box_idx = row_idx // 3 * 3 + col_idx // 3
+                cell.board_idx = row_idx * 9 + col_idx
+                cell.setFont(cell_font)
+                cell.setAlignment(_CELL_ALIGNMENT)
+                cell.setMaxLength(1)
+                cell.setValidator(cell_validator)
+                cell.textEdited.connect(self._on_cell_text_edited)
+
+        # Palettes of the cells for each text color.
+        self._cell_palettes: dict[tuple[int, int, int], QtGui.QPalette] = {}
+        for rgb_color, color in _QCOLORS.items():
+            palette = QtGui.QPalette(self._cells[0][0].palette())
+            palette.setColor(QtGui.QPalette.ColorRole.Text, color)
+            self._cell_palettes[rgb_color] = palette
+
+        new_game_button = self._ui.newGameButton
+        self.hint_button = self._ui.hintButton
+        self.check_numbers_button = self._ui.checkNumbersButton
+        self.difficulty_combobox = self._ui.difficultyComboBox
+
+        # Puzzles are generated in the background, ready for the next new game.
+        self._next_puzzles: dict[float, tuple[array.array, array.array]] = {}
+        self._prefetching_levels: set[float] = set()
+        self._puzzle_worker_signals = _PuzzleWorkerSignals(self)
+        self._puzzle_worker_signals.puzzle_generated.connect(self._store_next_puzzle)
+        self.difficulty_combobox.currentTextChanged.connect(self._prefetch_puzzle)
 
         new_game_button.clicked.connect(self.create_new_game)
         self.hint_button.clicked.connect(self.provide_a_hint)
@@ -55,31 +114,52 @@ class SudokuMainWindow(QtWidgets.QMainWindow):
 
         self.timer = QtCore.QTimer(parent=self)
         self.timer.timeout.connect(self.update_displayed_time)
-        self.seconds_on_game = 0
-
-        self.board = []
-        self.solved_board = []
+        self.game_elapsed_timer = QtCore.QElapsedTimer()
+
+        # Boards are stored flattened (row-major), with '0' for the empty cells.
+        self.board = array.array("b")
+        self.solved_board = array.array("b")
+        # Bit 'v' of each mask is set if the value 'v' is used within the unit.
+        # The counts of each value per unit allow clearing a bit only once no cell
+        # of the unit holds the value, as the user can repeat values.
+        self._row_masks = [0] * 9
+        self._col_masks = [0] * 9
+        self._box_masks = [0] * 9
+        self._row_counts = [[0] * 10 for _ in range(9)]
+        self._col_counts = [[0] * 10 for _ in range(9)]
+        self._box_counts = [[0] * 10 for _ in range(9)]
+        # Flat indexes of the cells whose value differs from the solution.
+        self._wrong_cells: set[int] = set()
         self._reset_board()
+        self._prefetch_puzzle()
 
-    def get_cell(self, row_idx: int, col_idx: int) -> QtWidgets.QTextEdit:
+    def get_cell(self, row_idx: int, col_idx: int) -> QtWidgets.QLineEdit:
         """Obtaining a single cell."""
-        return self.findChild(QtWidgets.QTextEdit, f"cell_{row_idx}_{col_idx}")
+        return self._cells[row_idx][col_idx]
 
     def enable_hint_buttons(self, enabled: bool) -> None:
         """Enabling/Disabling the buttons that provide hints to the user."""
-        for button_name in ("hintButton", "checkNumbersButton"):
-            self.findChild(QtWidgets.QPushButton, button_name).setEnabled(enabled)
+        self.hint_button.setEnabled(enabled)
+        self.check_numbers_button.setEnabled(enabled)
 
-    def iterate_over_all_cells(self) -> Iterator[QtWidgets.QTextEdit]:
+    def iterate_over_all_cells(self) -> Iterator[QtWidgets.QLineEdit]:
         """Iteration over all the cells at the board."""
-        for row_idx in range(9):
-            for col_idx in range(9):
-                yield self.get_cell(row_idx, col_idx)
+        for row in self._cells:
+            yield from row
+
+    def is_value_allowed(self, row_idx: int, col_idx: int, value: int) -> bool:
+        """If a value is not yet used within the row, column and box of a cell."""
+        used_values = (
+            self._row_masks[row_idx]
+            | self._col_masks[col_idx]
+            | self._box_masks[row_idx // 3 * 3 + col_idx // 3]
+        )
+        return not used_values & (1 << value)
 
     @property
     def is_board_solved(self) -> bool:
-        """If the sudoku puzzle is solved."""
-        return self.board == self.solved_board
+        """If the sudoku puzzle is solved (no cell differs from the solution)."""
+        return not self._wrong_cells
 
     def end_game(self) -> None:
         """Routine for the end of the game (the puzzle is solved)."""
@@ -91,48 +171,44 @@ class SudokuMainWindow(QtWidgets.QMainWindow):
         )
         self.enable_hint_buttons(False)
 
+    @QtCore.pyqtSlot()
     def update_displayed_time(self) -> None:
         """Updating the time displayed at the status bar."""
-        self.seconds_on_game += 1
-        minutes, seconds = divmod(self.seconds_on_game, 60)
-        hours, minutes = divmod(minutes, 60)
-        self.statusBar().showMessage(f"{hours:02}:{minutes:02}:{seconds:02}")
+        # Rounded to the closest second, as the timer may time out slightly early.
+        seconds_on_game = round(self.game_elapsed_timer.elapsed() / 1000)
+        self.statusBar().showMessage(
+            QtCore.QTime(0, 0).addSecs(seconds_on_game).toString("hh:mm:ss")
+        )
 
+    @QtCore.pyqtSlot()
     def create_new_game(self) -> None:
         """Creates a new sudoku game.
 
         When a new game is created:
             - All the cells are cleared and set to read and write.
             - A new sudoku puzzle (with only one solution) is created and the
-              solution is stored.
+              solution is stored. A puzzle generated in the background is used if
+              available, and the generation of the next one is started.
             - The initial values are defined at each cell. These cells are set to
               read only.
         """
-        self._reset_board()
-
-        if self.difficulty_combobox.currentText() == "Easy":
-            difficulty_level = 0.3
-        elif self.difficulty_combobox.currentText() == "Medium":
-            difficulty_level = 0.45
-        else:
-            difficulty_level = 0.6
-
-        while True:
-            puzzle = Sudoku(seed=random.randint(0, 500)).difficulty(difficulty_level)
-            if puzzle.has_multiple_solutions():
-                continue
-            self.board = puzzle.board
-            self.solved_board = puzzle.solve().board
-            break
-
-        for row_idx, row_values in enumerate(self.board):
-            for col_idx, cell_value in enumerate(row_values):
-                cell = self.get_cell(row_idx, col_idx)
+        difficulty_level = _DIFFICULTY_LEVELS[self.difficulty_combobox.currentText()]
+        puzzle = self._next_puzzles.pop(difficulty_level, None)
+        if puzzle is None:
+            # No puzzle was prefetched yet.
+            puzzle = generate_puzzle(difficulty_level)
+        initial_board, solved_board = puzzle
+
+        with self._updates_disabled():
+            self._reset_board()
+            self.solved_board = solved_board
+
+            for cell, cell_value in zip(self.iterate_over_all_cells(), initial_board):
                 cell.setEnabled(True)
-                if cell_value is None:
+                if cell_value == 0:
                     continue
                 self._set_cell_value(
-                    cell=self.get_cell(row_idx, col_idx),
+                    cell=cell,
                     value=cell_value,
                     read_only=True,
                     rgb_color=BLACK,
@@ -140,54 +216,50 @@ class SudokuMainWindow(QtWidgets.QMainWindow):
 
         self.enable_hint_buttons(True)
         self.timer.start(1000)
-        self.seconds_on_game = 0
+        self.game_elapsed_timer.start()
         self.statusBar().showMessage("00:00:00")
+        self._prefetch_puzzle()
 
+    @QtCore.pyqtSlot()
     def provide_a_hint(self) -> None:
         """Updates one cell of the current board to provide a hint to the user."""
-        row_indexes, col_indexes = list(range(9)), list(range(9))
-        random.shuffle(row_indexes)
-        random.shuffle(col_indexes)
-
-        for row_idx in row_indexes:
-            for col_idx in col_indexes:
-                board_value = self.board[row_idx][col_idx]
-                correct_value = self.solved_board[row_idx][col_idx]
-
-                if board_value == correct_value:
-                    continue
+        if not self._wrong_cells:
+            return
 
-                if board_value is None:
-                    # Cell is empty.
-                    new_cell_value = correct_value
-                    color = GREEN
-                else:
-                    # Cell has incorrect value.
-                    new_cell_value = board_value
-                    color = RED
+        board_idx = random.choice(tuple(self._wrong_cells))
+        board_value = self.board[board_idx]
+        correct_value = self.solved_board[board_idx]
 
-                self._set_cell_value(
-                    cell=self.get_cell(row_idx, col_idx),
-                    value=new_cell_value,
-                    rgb_color=color,
-                )
-                return
+        if board_value == 0:
+            # Cell is empty.
+            new_cell_value = correct_value
+            color = GREEN
+        else:
+            # Cell has incorrect value.
+            new_cell_value = board_value
+            color = RED
+
+        self._set_cell_value(
+            cell=self.get_cell(*divmod(board_idx, 9)),
+            value=new_cell_value,
+            rgb_color=color,
+        )
 
+    @QtCore.pyqtSlot()
     def check_numbers_in_cells(self) -> None:
         """Iterates over all the cells to paint."""
-        for cell in self.iterate_over_all_cells():
-            if cell.isReadOnly():
-                # Ignoring the cells that were set as the initial state.
-                continue
+        # Attributes bound to locals, as they are accessed for each of the cells.
+        board, solved_board = self.board, self.solved_board
+        set_cell_value = self._set_cell_value
 
-            if cell.toPlainText() == "":
+        for cell in self.iterate_over_all_cells():
+            # Ignoring the cells that were set as the initial state and empty ones.
+            if cell.isReadOnly() or not cell.text():
                 continue
 
-            cell_row, cell_col = [int(idx) for idx in cell.objectName().split("_")[-2:]]
-            board_number = self.board[cell_row][cell_col]
-            correct_number = self.solved_board[cell_row][cell_col]
-
-            self._set_cell_value(
+            board_number = board[cell.board_idx]
+            correct_number = solved_board[cell.board_idx]
+            set_cell_value(
                 cell=cell,
                 value=board_number,
                 rgb_color=RED if board_number != correct_number else GREEN,
@@ -197,17 +269,68 @@ class SudokuMainWindow(QtWidgets.QMainWindow):
         """Resetting/Clearing the board.
 
         The following steps are performed:
-            1. All values within the board are set to 'None'.
-            2. Every cell (QTextEdit) is cleared to an initial status.
+            1. All values within the board are set to '0' (empty) and the masks of
+               used values are cleared. All cells are then considered wrong.
+            2. Every cell (QLineEdit) is cleared to an initial status.
         """
-        self.board = [[None] * 9 for _ in range(9)]
-        for cell in self.iterate_over_all_cells():
-            self._set_cell_value(cell=cell, value=None)
-            cell.setEnabled(False)
+        self.board = array.array("b", bytes(81))
+        self._wrong_cells = set(range(81))
+        self._row_masks = [0] * 9
+        self._col_masks = [0] * 9
+        self._box_masks = [0] * 9
+        self._row_counts = [[0] * 10 for _ in range(9)]
+        self._col_counts = [[0] * 10 for _ in range(9)]
+        self._box_counts = [[0] * 10 for _ in range(9)]
+        with self._updates_disabled():
+            for cell in self.iterate_over_all_cells():
+                self._set_cell_value(cell=cell, value=None)
+                cell.setEnabled(False)
+
+    @QtCore.pyqtSlot()
+    def _prefetch_puzzle(self) -> None:
+        """Starts generating a puzzle of the selected difficulty in the background.
+
+        Nothing is done if such a puzzle is already available or being generated.
+        """
+        difficulty_level = _DIFFICULTY_LEVELS[self.difficulty_combobox.currentText()]
+        if (
+            difficulty_level in self._next_puzzles
+            or difficulty_level in self._prefetching_levels
+        ):
+            return
+        self._prefetching_levels.add(difficulty_level)
+        QtCore.QThreadPool.globalInstance().start(
+            _PuzzleWorker(difficulty_level, self._puzzle_worker_signals)
+        )
+
+    @QtCore.pyqtSlot(float, object, object)
+    def _store_next_puzzle(
+        self,
+        difficulty_level: float,
+        initial_board: array.array,
+        solved_board: array.array,
+    ) -> None:
+        """Stores a puzzle generated in the background for the next new game."""
+        self._prefetching_levels.discard(difficulty_level)
+        self._next_puzzles[difficulty_level] = (initial_board, solved_board)
+
+    @contextlib.contextmanager
+    def _updates_disabled(self) -> Iterator[None]:
+        """Context to disable the window updates while modifying several cells.
+
+        A single repaint is then performed when leaving the context. The previous
+        state is restored, allowing to nest the context.
+        """
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
     def _set_cell_value(
         self,
-        cell: QtWidgets.QTextEdit,
+        cell: QtWidgets.QLineEdit,
         value: Optional[int | str],
         read_only: bool = False,
         rgb_color: tuple[int, int, int] = BLUE,
@@ -216,56 +339,67 @@ class SudokuMainWindow(QtWidgets.QMainWindow):
 
         Parameters
         ----------
-        cell : QTextEdit
+        cell : QLineEdit
             Widget corresponding to the cell.
         value : int, optional
             Value to set within the cell. If 'None' is passed, the cell is cleared.
         read_only : bool
             Boolean to define if the widget should be read only.
+        rgb_color : tuple of int
+            RGB color of the displayed value.
         """
-        with contextlib.suppress(TypeError):
-            cell.disconnect()  # Raises TypeError if there is no connection.
-
-        cell.setTextColor(QtGui.QColor.fromRgb(*rgb_color))
-        if value is None:
-            cell.clear()
-        else:
-            cell.setText(str(value))
-        cell.setReadOnly(read_only)
-        cell.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        cell.setFontPointSize(15)
-
-        # Obtain cell coordinates & updating the stored values.
-        if value is not None:
-            *_, row_idx, col_idx = cell.objectName().split("_")
-            self.board[int(row_idx)][int(col_idx)] = int(value)
-
+        # The widget is only modified if its displayed state differs.
+        # No signal needs to be blocked, as 'textEdited' is only emitted on user edits.
+        if cell.palette().color(QtGui.QPalette.ColorRole.Text) != _QCOLORS[rgb_color]:
+            cell.setPalette(self._cell_palettes[rgb_color])
+        text = "" if value is None else str(value)
+        if cell.text() != text:
+            cell.setText(text)
+        if cell.isReadOnly() != read_only:
+            cell.setReadOnly(read_only)
+
+        self._update_board_value(cell, 0 if value is None else int(value))
         if self.is_board_solved:
             self.end_game()
-        else:
-            cell.textChanged.connect(lambda: self._validate_cell_text(cell))
 
-    def _validate_cell_text(self, cell: QtWidgets.QTextEdit) -> None:
-        """Validation of the text contained within a cell.
+    def _update_board_value(self, cell: QtWidgets.QLineEdit, value: int) -> None:
+        """Stores the value of a cell within the board.
 
-        Within the sudoku board, only the numbers from 1 to 9 are allowed.
-        The validation of a cell consist in:
-            1. If the length is longer than 1 character, only the first character
-               remains.
-            2. If the character is not a number or an invalid number, the cell
-               is cleared.
-
-        The validation is performed only for those cells that are modifiable by the
-        user.
+        The masks of used values and the set of wrong cells are updated as well.
+        As the user can repeat values within a unit (row, column or box), the bit of
+        a removed value is only cleared once its count within the unit reaches 0.
         """
-        if cell.isReadOnly():
+        previous_value = self.board[cell.board_idx]
+        if previous_value == value:
             return
-        text = cell.toPlainText()
-        if len(text) > 1:
-            text = text[0]
-        if text not in self._VALID_CELL_VALUES:
-            text = None
-        self._set_cell_value(cell=cell, value=text)
+        self.board[cell.board_idx] = value
+        if value == self.solved_board[cell.board_idx]:
+            self._wrong_cells.discard(cell.board_idx)
+        else:
+            self._wrong_cells.add(cell.board_idx)
+
+        units = (
+            (self._row_masks, self._row_counts[cell.row_idx], cell.row_idx),
+            (self._col_masks, self._col_counts[cell.col_idx], cell.col_idx),
+            (self._box_masks, self._box_counts[cell.box_idx], cell.box_idx),
+        )
+        for masks, counts, unit_idx in units:
+            if previous_value:
+                counts[previous_value] -= 1
+                if counts[previous_value] == 0:
+                    masks[unit_idx] &= ~(1 << previous_value)
+            if value:
+                counts[value] += 1
+                masks[unit_idx] |= 1 << value
+
+    @QtCore.pyqtSlot(str)
+    def _on_cell_text_edited(self, text: str) -> None:
+        """Stores the value written by the user within the cell emitting the signal.
+
+        Only the numbers from 1 to 9 can be written, as the cells validate their
+        input themselves.
+        """
+        self._set_cell_value(cell=self.sender(), value=text or None)
 
     # ***********************
     # Qt overloaded functions
@@ -0,0 +1,143 @@
+"""Module containing the generator of the sudoku puzzles and its solver."""
+
+from __future__ import annotations
+
+import array
+import random
+from typing import Optional, Sequence
+
+# Bits 1 to 9 set: all the values are candidates.
+_ALL_VALUES_MASK = 0b1111111110
+# Number of bits set on each mask of candidates.
+_BIT_COUNTS = tuple(bin(mask).count("1") for mask in range(_ALL_VALUES_MASK + 1))
+
+# Indexes of the row, column and box masks of each flat board index. The masks
+# are stored in a single list: rows at 0-8, columns at 9-17 and boxes at 18-26.
+_UNITS_OF = tuple(
+    (idx // 9, 9 + idx % 9, 18 + idx // 27 * 3 + idx % 9 // 3) for idx in range(81)
+)
+
+
+def solve_sudoku(board: Sequence[int]) -> tuple[Optional[array.array], bool]:
+    """Solves a sudoku board, checking at the same time if the solution is unique.
+
+    A depth-first search is performed, always filling first the empty cell with
+    the fewest candidates. The values used within each row, column and box are
+    tracked as bitmasks. The search stops once a second solution is found.
+
+    Parameters
+    ----------
+    board : sequence of int
+        Flattened (row-major) board, with '0' for the empty cells.
+
+    Returns
+    -------
+    tuple of (array, optional) and bool
+        The first solution found, flattened, or 'None' if the board has no
+        solution. The boolean is 'True' if that solution is the only one.
+    """
+    cells = array.array("b", board)
+    masks = [0] * 27
+    empty_cells = []
+    for idx, value in enumerate(cells):
+        if value == 0:
+            empty_cells.append(idx)
+            continue
+        bit = 1 << value
+        row, col, box = _UNITS_OF[idx]
+        if (masks[row] | masks[col] | masks[box]) & bit:
+            # Repeated value within a unit.
+            return None, False
+        masks[row] |= bit
+        masks[col] |= bit
+        masks[box] |= bit
+
+    solutions: list[array.array] = []
+    # Module tables bound to the closure, as the search is the hot path.
+    units_of, bit_counts = _UNITS_OF, _BIT_COUNTS
+
+    def search(remaining: int) -> None:
+        """Fills the cells within 'empty_cells[:remaining]'."""
+        if remaining == 0:
+            solutions.append(array.array("b", cells))
+            return
+
+        # Minimum remaining values: choosing the cell with the fewest candidates.
+        best_pos, best_candidates, best_count = 0, 0, 10
+        for pos in range(remaining):
+            row, col, box = units_of[empty_cells[pos]]
+            candidates = _ALL_VALUES_MASK & ~(masks[row] | masks[col] | masks[box])
+            count = bit_counts[candidates]
+            if count < best_count:
+                if count == 0:
+                    # Dead end: a cell without candidates.
+                    return
+                best_pos, best_candidates, best_count = pos, candidates, count
+                if count == 1:
+                    break
+
+        # The chosen cell is swapped to the end of the remaining ones.
+        last = remaining - 1
+        idx = empty_cells[best_pos]
+        empty_cells[best_pos] = empty_cells[last]
+        empty_cells[last] = idx
+        row, col, box = units_of[idx]
+
+        while best_candidates:
+            bit = best_candidates & -best_candidates
+            best_candidates ^= bit
+            cells[idx] = bit.bit_length() - 1
+            masks[row] |= bit
+            masks[col] |= bit
+            masks[box] |= bit
+            search(last)
+            masks[row] ^= bit
+            masks[col] ^= bit
+            masks[box] ^= bit
+            if len(solutions) > 1:
+                break
+        cells[idx] = 0
+
+    search(len(empty_cells))
+    if not solutions:
+        return None, False
+    return solutions[0], len(solutions) == 1
+
+
+def generate_puzzle(difficulty_level: float) -> tuple[array.array, array.array]:
+    """Generates a sudoku puzzle with only one solution.
+
+    Parameters
+    ----------
+    difficulty_level : float
+        Ratio of empty cells within the puzzle.
+
+    Returns
+    -------
+    tuple of array
+        The flattened initial and solved boards, with '0' for the empty cells.
+    """
+    # A private generator is used, as puzzles are generated in background threads
+    # and the global random state must not be modified from them.
+    rng = random.Random()
+
+    # The seed board holds one value per row, each one in a different column
+    # (value 'col + 1' at column 'col'). Any such board can be solved.
+    seed_board = [0] * 81
+    seed_cols = list(range(9))
+    rng.shuffle(seed_cols)
+    for row, col in enumerate(seed_cols):
+        seed_board[row * 9 + col] = col + 1
+    solved_board, _ = solve_sudoku(seed_board)
+
+    # Cells are removed from the solved board until the puzzle has one solution.
+    while True:
+        initial_board = array.array("b", solved_board)
+        cell_indexes = list(range(81))
+        rng.shuffle(cell_indexes)
+        for idx in cell_indexes[: int(difficulty_level * 81)]:
+            initial_board[idx] = 0
+        # The uniqueness is checked with a single search, which also solves it.
+        _, is_unique = solve_sudoku(initial_board)
+        if is_unique:
+            return initial_board, solved_board
@@ -0,0 +1,950 @@
+# Form implementation generated from reading ui file 'sudoku_main_win.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(604, 654)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.centralwidget)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem = QtWidgets.QSpacerItem(34, 17, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        spacerItem1 = QtWidgets.QSpacerItem(17, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem1)
+        self.boardFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.boardFrame.setObjectName("boardFrame")
+        self.boardLayout = QtWidgets.QGridLayout(self.boardFrame)
+        self.boardLayout.setSpacing(10)
+        self.boardLayout.setObjectName("boardLayout")
+        self.majCell_01 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_01.setObjectName("majCell_01")
+        self.majCell_1 = QtWidgets.QGridLayout(self.majCell_01)
+        self.majCell_1.setObjectName("majCell_1")
+        self.cell_0_3 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_3.sizePolicy().hasHeightForWidth())
+        self.cell_0_3.setSizePolicy(sizePolicy)
+        self.cell_0_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_3.setObjectName("cell_0_3")
+        self.majCell_1.addWidget(self.cell_0_3, 0, 0, 1, 1)
+        self.cell_0_4 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_4.sizePolicy().hasHeightForWidth())
+        self.cell_0_4.setSizePolicy(sizePolicy)
+        self.cell_0_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_4.setObjectName("cell_0_4")
+        self.majCell_1.addWidget(self.cell_0_4, 0, 1, 1, 1)
+        self.cell_0_5 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_5.sizePolicy().hasHeightForWidth())
+        self.cell_0_5.setSizePolicy(sizePolicy)
+        self.cell_0_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_5.setObjectName("cell_0_5")
+        self.majCell_1.addWidget(self.cell_0_5, 0, 2, 1, 1)
+        self.cell_1_3 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_3.sizePolicy().hasHeightForWidth())
+        self.cell_1_3.setSizePolicy(sizePolicy)
+        self.cell_1_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_3.setObjectName("cell_1_3")
+        self.majCell_1.addWidget(self.cell_1_3, 1, 0, 1, 1)
+        self.cell_1_4 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_4.sizePolicy().hasHeightForWidth())
+        self.cell_1_4.setSizePolicy(sizePolicy)
+        self.cell_1_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_4.setObjectName("cell_1_4")
+        self.majCell_1.addWidget(self.cell_1_4, 1, 1, 1, 1)
+        self.cell_1_5 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_5.sizePolicy().hasHeightForWidth())
+        self.cell_1_5.setSizePolicy(sizePolicy)
+        self.cell_1_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_5.setObjectName("cell_1_5")
+        self.majCell_1.addWidget(self.cell_1_5, 1, 2, 1, 1)
+        self.cell_2_3 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_3.sizePolicy().hasHeightForWidth())
+        self.cell_2_3.setSizePolicy(sizePolicy)
+        self.cell_2_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_3.setObjectName("cell_2_3")
+        self.majCell_1.addWidget(self.cell_2_3, 2, 0, 1, 1)
+        self.cell_2_4 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_4.sizePolicy().hasHeightForWidth())
+        self.cell_2_4.setSizePolicy(sizePolicy)
+        self.cell_2_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_4.setObjectName("cell_2_4")
+        self.majCell_1.addWidget(self.cell_2_4, 2, 1, 1, 1)
+        self.cell_2_5 = QtWidgets.QLineEdit(parent=self.majCell_01)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_5.sizePolicy().hasHeightForWidth())
+        self.cell_2_5.setSizePolicy(sizePolicy)
+        self.cell_2_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_5.setObjectName("cell_2_5")
+        self.majCell_1.addWidget(self.cell_2_5, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_01, 0, 1, 1, 1)
+        self.majCell_11 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_11.setObjectName("majCell_11")
+        self.majCell_4 = QtWidgets.QGridLayout(self.majCell_11)
+        self.majCell_4.setObjectName("majCell_4")
+        self.cell_3_3 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_3.sizePolicy().hasHeightForWidth())
+        self.cell_3_3.setSizePolicy(sizePolicy)
+        self.cell_3_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_3.setObjectName("cell_3_3")
+        self.majCell_4.addWidget(self.cell_3_3, 0, 0, 1, 1)
+        self.cell_3_4 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_4.sizePolicy().hasHeightForWidth())
+        self.cell_3_4.setSizePolicy(sizePolicy)
+        self.cell_3_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_4.setObjectName("cell_3_4")
+        self.majCell_4.addWidget(self.cell_3_4, 0, 1, 1, 1)
+        self.cell_3_5 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_5.sizePolicy().hasHeightForWidth())
+        self.cell_3_5.setSizePolicy(sizePolicy)
+        self.cell_3_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_5.setObjectName("cell_3_5")
+        self.majCell_4.addWidget(self.cell_3_5, 0, 2, 1, 1)
+        self.cell_4_3 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_3.sizePolicy().hasHeightForWidth())
+        self.cell_4_3.setSizePolicy(sizePolicy)
+        self.cell_4_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_3.setObjectName("cell_4_3")
+        self.majCell_4.addWidget(self.cell_4_3, 1, 0, 1, 1)
+        self.cell_4_4 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_4.sizePolicy().hasHeightForWidth())
+        self.cell_4_4.setSizePolicy(sizePolicy)
+        self.cell_4_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_4.setObjectName("cell_4_4")
+        self.majCell_4.addWidget(self.cell_4_4, 1, 1, 1, 1)
+        self.cell_4_5 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_5.sizePolicy().hasHeightForWidth())
+        self.cell_4_5.setSizePolicy(sizePolicy)
+        self.cell_4_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_5.setObjectName("cell_4_5")
+        self.majCell_4.addWidget(self.cell_4_5, 1, 2, 1, 1)
+        self.cell_5_3 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_3.sizePolicy().hasHeightForWidth())
+        self.cell_5_3.setSizePolicy(sizePolicy)
+        self.cell_5_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_3.setObjectName("cell_5_3")
+        self.majCell_4.addWidget(self.cell_5_3, 2, 0, 1, 1)
+        self.cell_5_4 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_4.sizePolicy().hasHeightForWidth())
+        self.cell_5_4.setSizePolicy(sizePolicy)
+        self.cell_5_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_4.setObjectName("cell_5_4")
+        self.majCell_4.addWidget(self.cell_5_4, 2, 1, 1, 1)
+        self.cell_5_5 = QtWidgets.QLineEdit(parent=self.majCell_11)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_5.sizePolicy().hasHeightForWidth())
+        self.cell_5_5.setSizePolicy(sizePolicy)
+        self.cell_5_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_5.setObjectName("cell_5_5")
+        self.majCell_4.addWidget(self.cell_5_5, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_11, 1, 1, 1, 1)
+        self.majCell_00 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_00.setObjectName("majCell_00")
+        self.majCell_0 = QtWidgets.QGridLayout(self.majCell_00)
+        self.majCell_0.setObjectName("majCell_0")
+        self.cell_0_0 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_0.sizePolicy().hasHeightForWidth())
+        self.cell_0_0.setSizePolicy(sizePolicy)
+        self.cell_0_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_0.setObjectName("cell_0_0")
+        self.majCell_0.addWidget(self.cell_0_0, 0, 0, 1, 1)
+        self.cell_0_1 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_1.sizePolicy().hasHeightForWidth())
+        self.cell_0_1.setSizePolicy(sizePolicy)
+        self.cell_0_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_1.setObjectName("cell_0_1")
+        self.majCell_0.addWidget(self.cell_0_1, 0, 1, 1, 1)
+        self.cell_0_2 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_2.sizePolicy().hasHeightForWidth())
+        self.cell_0_2.setSizePolicy(sizePolicy)
+        self.cell_0_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_2.setObjectName("cell_0_2")
+        self.majCell_0.addWidget(self.cell_0_2, 0, 2, 1, 1)
+        self.cell_1_0 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_0.sizePolicy().hasHeightForWidth())
+        self.cell_1_0.setSizePolicy(sizePolicy)
+        self.cell_1_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_0.setObjectName("cell_1_0")
+        self.majCell_0.addWidget(self.cell_1_0, 1, 0, 1, 1)
+        self.cell_1_1 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_1.sizePolicy().hasHeightForWidth())
+        self.cell_1_1.setSizePolicy(sizePolicy)
+        self.cell_1_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_1.setObjectName("cell_1_1")
+        self.majCell_0.addWidget(self.cell_1_1, 1, 1, 1, 1)
+        self.cell_1_2 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_2.sizePolicy().hasHeightForWidth())
+        self.cell_1_2.setSizePolicy(sizePolicy)
+        self.cell_1_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_2.setObjectName("cell_1_2")
+        self.majCell_0.addWidget(self.cell_1_2, 1, 2, 1, 1)
+        self.cell_2_0 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_0.sizePolicy().hasHeightForWidth())
+        self.cell_2_0.setSizePolicy(sizePolicy)
+        self.cell_2_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_0.setObjectName("cell_2_0")
+        self.majCell_0.addWidget(self.cell_2_0, 2, 0, 1, 1)
+        self.cell_2_1 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_1.sizePolicy().hasHeightForWidth())
+        self.cell_2_1.setSizePolicy(sizePolicy)
+        self.cell_2_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_1.setObjectName("cell_2_1")
+        self.majCell_0.addWidget(self.cell_2_1, 2, 1, 1, 1)
+        self.cell_2_2 = QtWidgets.QLineEdit(parent=self.majCell_00)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_2.sizePolicy().hasHeightForWidth())
+        self.cell_2_2.setSizePolicy(sizePolicy)
+        self.cell_2_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_2.setObjectName("cell_2_2")
+        self.majCell_0.addWidget(self.cell_2_2, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_00, 0, 0, 1, 1)
+        self.majCell_02 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_02.setObjectName("majCell_02")
+        self.majCell_2 = QtWidgets.QGridLayout(self.majCell_02)
+        self.majCell_2.setObjectName("majCell_2")
+        self.cell_0_6 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_6.sizePolicy().hasHeightForWidth())
+        self.cell_0_6.setSizePolicy(sizePolicy)
+        self.cell_0_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_6.setObjectName("cell_0_6")
+        self.majCell_2.addWidget(self.cell_0_6, 0, 0, 1, 1)
+        self.cell_0_7 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_7.sizePolicy().hasHeightForWidth())
+        self.cell_0_7.setSizePolicy(sizePolicy)
+        self.cell_0_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_7.setObjectName("cell_0_7")
+        self.majCell_2.addWidget(self.cell_0_7, 0, 1, 1, 1)
+        self.cell_0_8 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_0_8.sizePolicy().hasHeightForWidth())
+        self.cell_0_8.setSizePolicy(sizePolicy)
+        self.cell_0_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_0_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_0_8.setObjectName("cell_0_8")
+        self.majCell_2.addWidget(self.cell_0_8, 0, 2, 1, 1)
+        self.cell_1_6 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_6.sizePolicy().hasHeightForWidth())
+        self.cell_1_6.setSizePolicy(sizePolicy)
+        self.cell_1_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_6.setObjectName("cell_1_6")
+        self.majCell_2.addWidget(self.cell_1_6, 1, 0, 1, 1)
+        self.cell_1_7 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_7.sizePolicy().hasHeightForWidth())
+        self.cell_1_7.setSizePolicy(sizePolicy)
+        self.cell_1_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_7.setObjectName("cell_1_7")
+        self.majCell_2.addWidget(self.cell_1_7, 1, 1, 1, 1)
+        self.cell_1_8 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_1_8.sizePolicy().hasHeightForWidth())
+        self.cell_1_8.setSizePolicy(sizePolicy)
+        self.cell_1_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_1_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_1_8.setObjectName("cell_1_8")
+        self.majCell_2.addWidget(self.cell_1_8, 1, 2, 1, 1)
+        self.cell_2_6 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_6.sizePolicy().hasHeightForWidth())
+        self.cell_2_6.setSizePolicy(sizePolicy)
+        self.cell_2_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_6.setObjectName("cell_2_6")
+        self.majCell_2.addWidget(self.cell_2_6, 2, 0, 1, 1)
+        self.cell_2_7 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_7.sizePolicy().hasHeightForWidth())
+        self.cell_2_7.setSizePolicy(sizePolicy)
+        self.cell_2_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_7.setObjectName("cell_2_7")
+        self.majCell_2.addWidget(self.cell_2_7, 2, 1, 1, 1)
+        self.cell_2_8 = QtWidgets.QLineEdit(parent=self.majCell_02)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_2_8.sizePolicy().hasHeightForWidth())
+        self.cell_2_8.setSizePolicy(sizePolicy)
+        self.cell_2_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_2_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_2_8.setObjectName("cell_2_8")
+        self.majCell_2.addWidget(self.cell_2_8, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_02, 0, 2, 1, 1)
+        self.majCell_12 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_12.setObjectName("majCell_12")
+        self.majCell_5 = QtWidgets.QGridLayout(self.majCell_12)
+        self.majCell_5.setObjectName("majCell_5")
+        self.cell_3_6 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_6.sizePolicy().hasHeightForWidth())
+        self.cell_3_6.setSizePolicy(sizePolicy)
+        self.cell_3_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_6.setObjectName("cell_3_6")
+        self.majCell_5.addWidget(self.cell_3_6, 0, 0, 1, 1)
+        self.cell_3_7 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_7.sizePolicy().hasHeightForWidth())
+        self.cell_3_7.setSizePolicy(sizePolicy)
+        self.cell_3_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_7.setObjectName("cell_3_7")
+        self.majCell_5.addWidget(self.cell_3_7, 0, 1, 1, 1)
+        self.cell_3_8 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_8.sizePolicy().hasHeightForWidth())
+        self.cell_3_8.setSizePolicy(sizePolicy)
+        self.cell_3_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_8.setObjectName("cell_3_8")
+        self.majCell_5.addWidget(self.cell_3_8, 0, 2, 1, 1)
+        self.cell_4_6 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_6.sizePolicy().hasHeightForWidth())
+        self.cell_4_6.setSizePolicy(sizePolicy)
+        self.cell_4_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_6.setObjectName("cell_4_6")
+        self.majCell_5.addWidget(self.cell_4_6, 1, 0, 1, 1)
+        self.cell_4_7 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_7.sizePolicy().hasHeightForWidth())
+        self.cell_4_7.setSizePolicy(sizePolicy)
+        self.cell_4_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_7.setObjectName("cell_4_7")
+        self.majCell_5.addWidget(self.cell_4_7, 1, 1, 1, 1)
+        self.cell_4_8 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_8.sizePolicy().hasHeightForWidth())
+        self.cell_4_8.setSizePolicy(sizePolicy)
+        self.cell_4_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_8.setObjectName("cell_4_8")
+        self.majCell_5.addWidget(self.cell_4_8, 1, 2, 1, 1)
+        self.cell_5_6 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_6.sizePolicy().hasHeightForWidth())
+        self.cell_5_6.setSizePolicy(sizePolicy)
+        self.cell_5_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_6.setObjectName("cell_5_6")
+        self.majCell_5.addWidget(self.cell_5_6, 2, 0, 1, 1)
+        self.cell_5_7 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_7.sizePolicy().hasHeightForWidth())
+        self.cell_5_7.setSizePolicy(sizePolicy)
+        self.cell_5_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_7.setObjectName("cell_5_7")
+        self.majCell_5.addWidget(self.cell_5_7, 2, 1, 1, 1)
+        self.cell_5_8 = QtWidgets.QLineEdit(parent=self.majCell_12)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_8.sizePolicy().hasHeightForWidth())
+        self.cell_5_8.setSizePolicy(sizePolicy)
+        self.cell_5_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_8.setObjectName("cell_5_8")
+        self.majCell_5.addWidget(self.cell_5_8, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_12, 1, 2, 1, 1)
+        self.majCell_10 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_10.setObjectName("majCell_10")
+        self.majCell_3 = QtWidgets.QGridLayout(self.majCell_10)
+        self.majCell_3.setObjectName("majCell_3")
+        self.cell_3_0 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_0.sizePolicy().hasHeightForWidth())
+        self.cell_3_0.setSizePolicy(sizePolicy)
+        self.cell_3_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_0.setObjectName("cell_3_0")
+        self.majCell_3.addWidget(self.cell_3_0, 0, 0, 1, 1)
+        self.cell_3_1 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_1.sizePolicy().hasHeightForWidth())
+        self.cell_3_1.setSizePolicy(sizePolicy)
+        self.cell_3_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_1.setObjectName("cell_3_1")
+        self.majCell_3.addWidget(self.cell_3_1, 0, 1, 1, 1)
+        self.cell_3_2 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_3_2.sizePolicy().hasHeightForWidth())
+        self.cell_3_2.setSizePolicy(sizePolicy)
+        self.cell_3_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_3_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_3_2.setObjectName("cell_3_2")
+        self.majCell_3.addWidget(self.cell_3_2, 0, 2, 1, 1)
+        self.cell_4_0 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_0.sizePolicy().hasHeightForWidth())
+        self.cell_4_0.setSizePolicy(sizePolicy)
+        self.cell_4_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_0.setObjectName("cell_4_0")
+        self.majCell_3.addWidget(self.cell_4_0, 1, 0, 1, 1)
+        self.cell_4_1 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_1.sizePolicy().hasHeightForWidth())
+        self.cell_4_1.setSizePolicy(sizePolicy)
+        self.cell_4_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_1.setObjectName("cell_4_1")
+        self.majCell_3.addWidget(self.cell_4_1, 1, 1, 1, 1)
+        self.cell_4_2 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_4_2.sizePolicy().hasHeightForWidth())
+        self.cell_4_2.setSizePolicy(sizePolicy)
+        self.cell_4_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_4_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_4_2.setObjectName("cell_4_2")
+        self.majCell_3.addWidget(self.cell_4_2, 1, 2, 1, 1)
+        self.cell_5_0 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_0.sizePolicy().hasHeightForWidth())
+        self.cell_5_0.setSizePolicy(sizePolicy)
+        self.cell_5_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_0.setObjectName("cell_5_0")
+        self.majCell_3.addWidget(self.cell_5_0, 2, 0, 1, 1)
+        self.cell_5_1 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_1.sizePolicy().hasHeightForWidth())
+        self.cell_5_1.setSizePolicy(sizePolicy)
+        self.cell_5_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_1.setObjectName("cell_5_1")
+        self.majCell_3.addWidget(self.cell_5_1, 2, 1, 1, 1)
+        self.cell_5_2 = QtWidgets.QLineEdit(parent=self.majCell_10)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_5_2.sizePolicy().hasHeightForWidth())
+        self.cell_5_2.setSizePolicy(sizePolicy)
+        self.cell_5_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_5_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_5_2.setObjectName("cell_5_2")
+        self.majCell_3.addWidget(self.cell_5_2, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_10, 1, 0, 1, 1)
+        self.majCell_20 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_20.setObjectName("majCell_20")
+        self.majCell_6 = QtWidgets.QGridLayout(self.majCell_20)
+        self.majCell_6.setObjectName("majCell_6")
+        self.cell_6_0 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_0.sizePolicy().hasHeightForWidth())
+        self.cell_6_0.setSizePolicy(sizePolicy)
+        self.cell_6_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_0.setObjectName("cell_6_0")
+        self.majCell_6.addWidget(self.cell_6_0, 0, 0, 1, 1)
+        self.cell_6_2 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_2.sizePolicy().hasHeightForWidth())
+        self.cell_6_2.setSizePolicy(sizePolicy)
+        self.cell_6_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_2.setObjectName("cell_6_2")
+        self.majCell_6.addWidget(self.cell_6_2, 0, 2, 1, 1)
+        self.cell_7_0 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_0.sizePolicy().hasHeightForWidth())
+        self.cell_7_0.setSizePolicy(sizePolicy)
+        self.cell_7_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_0.setObjectName("cell_7_0")
+        self.majCell_6.addWidget(self.cell_7_0, 1, 0, 1, 1)
+        self.cell_7_1 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_1.sizePolicy().hasHeightForWidth())
+        self.cell_7_1.setSizePolicy(sizePolicy)
+        self.cell_7_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_1.setObjectName("cell_7_1")
+        self.majCell_6.addWidget(self.cell_7_1, 1, 1, 1, 1)
+        self.cell_7_2 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_2.sizePolicy().hasHeightForWidth())
+        self.cell_7_2.setSizePolicy(sizePolicy)
+        self.cell_7_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_2.setObjectName("cell_7_2")
+        self.majCell_6.addWidget(self.cell_7_2, 1, 2, 1, 1)
+        self.cell_8_0 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_0.sizePolicy().hasHeightForWidth())
+        self.cell_8_0.setSizePolicy(sizePolicy)
+        self.cell_8_0.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_0.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_0.setObjectName("cell_8_0")
+        self.majCell_6.addWidget(self.cell_8_0, 2, 0, 1, 1)
+        self.cell_8_1 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_1.sizePolicy().hasHeightForWidth())
+        self.cell_8_1.setSizePolicy(sizePolicy)
+        self.cell_8_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_1.setObjectName("cell_8_1")
+        self.majCell_6.addWidget(self.cell_8_1, 2, 1, 1, 1)
+        self.cell_8_2 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_2.sizePolicy().hasHeightForWidth())
+        self.cell_8_2.setSizePolicy(sizePolicy)
+        self.cell_8_2.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_2.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_2.setObjectName("cell_8_2")
+        self.majCell_6.addWidget(self.cell_8_2, 2, 2, 1, 1)
+        self.cell_6_1 = QtWidgets.QLineEdit(parent=self.majCell_20)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_1.sizePolicy().hasHeightForWidth())
+        self.cell_6_1.setSizePolicy(sizePolicy)
+        self.cell_6_1.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_1.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_1.setObjectName("cell_6_1")
+        self.majCell_6.addWidget(self.cell_6_1, 0, 1, 1, 1)
+        self.boardLayout.addWidget(self.majCell_20, 2, 0, 1, 1)
+        self.majCell_21 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_21.setObjectName("majCell_21")
+        self.majCell_7 = QtWidgets.QGridLayout(self.majCell_21)
+        self.majCell_7.setObjectName("majCell_7")
+        self.cell_6_3 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_3.sizePolicy().hasHeightForWidth())
+        self.cell_6_3.setSizePolicy(sizePolicy)
+        self.cell_6_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_3.setObjectName("cell_6_3")
+        self.majCell_7.addWidget(self.cell_6_3, 0, 0, 1, 1)
+        self.cell_6_4 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_4.sizePolicy().hasHeightForWidth())
+        self.cell_6_4.setSizePolicy(sizePolicy)
+        self.cell_6_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_4.setObjectName("cell_6_4")
+        self.majCell_7.addWidget(self.cell_6_4, 0, 1, 1, 1)
+        self.cell_6_5 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_5.sizePolicy().hasHeightForWidth())
+        self.cell_6_5.setSizePolicy(sizePolicy)
+        self.cell_6_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_5.setObjectName("cell_6_5")
+        self.majCell_7.addWidget(self.cell_6_5, 0, 2, 1, 1)
+        self.cell_7_3 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_3.sizePolicy().hasHeightForWidth())
+        self.cell_7_3.setSizePolicy(sizePolicy)
+        self.cell_7_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_3.setObjectName("cell_7_3")
+        self.majCell_7.addWidget(self.cell_7_3, 1, 0, 1, 1)
+        self.cell_7_4 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_4.sizePolicy().hasHeightForWidth())
+        self.cell_7_4.setSizePolicy(sizePolicy)
+        self.cell_7_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_4.setObjectName("cell_7_4")
+        self.majCell_7.addWidget(self.cell_7_4, 1, 1, 1, 1)
+        self.cell_7_5 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_5.sizePolicy().hasHeightForWidth())
+        self.cell_7_5.setSizePolicy(sizePolicy)
+        self.cell_7_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_5.setObjectName("cell_7_5")
+        self.majCell_7.addWidget(self.cell_7_5, 1, 2, 1, 1)
+        self.cell_8_3 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_3.sizePolicy().hasHeightForWidth())
+        self.cell_8_3.setSizePolicy(sizePolicy)
+        self.cell_8_3.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_3.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_3.setObjectName("cell_8_3")
+        self.majCell_7.addWidget(self.cell_8_3, 2, 0, 1, 1)
+        self.cell_8_4 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_4.sizePolicy().hasHeightForWidth())
+        self.cell_8_4.setSizePolicy(sizePolicy)
+        self.cell_8_4.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_4.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_4.setObjectName("cell_8_4")
+        self.majCell_7.addWidget(self.cell_8_4, 2, 1, 1, 1)
+        self.cell_8_5 = QtWidgets.QLineEdit(parent=self.majCell_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_5.sizePolicy().hasHeightForWidth())
+        self.cell_8_5.setSizePolicy(sizePolicy)
+        self.cell_8_5.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_5.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_5.setObjectName("cell_8_5")
+        self.majCell_7.addWidget(self.cell_8_5, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_21, 2, 1, 1, 1)
+        self.majCell_22 = QtWidgets.QGroupBox(parent=self.boardFrame)
+        self.majCell_22.setTitle("")
+        self.majCell_22.setFlat(False)
+        self.majCell_22.setObjectName("majCell_22")
+        self.majCell_8 = QtWidgets.QGridLayout(self.majCell_22)
+        self.majCell_8.setObjectName("majCell_8")
+        self.cell_6_6 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_6.sizePolicy().hasHeightForWidth())
+        self.cell_6_6.setSizePolicy(sizePolicy)
+        self.cell_6_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_6.setObjectName("cell_6_6")
+        self.majCell_8.addWidget(self.cell_6_6, 0, 0, 1, 1)
+        self.cell_6_7 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_7.sizePolicy().hasHeightForWidth())
+        self.cell_6_7.setSizePolicy(sizePolicy)
+        self.cell_6_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_7.setObjectName("cell_6_7")
+        self.majCell_8.addWidget(self.cell_6_7, 0, 1, 1, 1)
+        self.cell_6_8 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_6_8.sizePolicy().hasHeightForWidth())
+        self.cell_6_8.setSizePolicy(sizePolicy)
+        self.cell_6_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_6_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_6_8.setObjectName("cell_6_8")
+        self.majCell_8.addWidget(self.cell_6_8, 0, 2, 1, 1)
+        self.cell_7_6 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_6.sizePolicy().hasHeightForWidth())
+        self.cell_7_6.setSizePolicy(sizePolicy)
+        self.cell_7_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_6.setObjectName("cell_7_6")
+        self.majCell_8.addWidget(self.cell_7_6, 1, 0, 1, 1)
+        self.cell_7_7 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_7.sizePolicy().hasHeightForWidth())
+        self.cell_7_7.setSizePolicy(sizePolicy)
+        self.cell_7_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_7.setObjectName("cell_7_7")
+        self.majCell_8.addWidget(self.cell_7_7, 1, 1, 1, 1)
+        self.cell_7_8 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_7_8.sizePolicy().hasHeightForWidth())
+        self.cell_7_8.setSizePolicy(sizePolicy)
+        self.cell_7_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_7_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_7_8.setObjectName("cell_7_8")
+        self.majCell_8.addWidget(self.cell_7_8, 1, 2, 1, 1)
+        self.cell_8_6 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_6.sizePolicy().hasHeightForWidth())
+        self.cell_8_6.setSizePolicy(sizePolicy)
+        self.cell_8_6.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_6.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_6.setObjectName("cell_8_6")
+        self.majCell_8.addWidget(self.cell_8_6, 2, 0, 1, 1)
+        self.cell_8_7 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_7.sizePolicy().hasHeightForWidth())
+        self.cell_8_7.setSizePolicy(sizePolicy)
+        self.cell_8_7.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_7.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_7.setObjectName("cell_8_7")
+        self.majCell_8.addWidget(self.cell_8_7, 2, 1, 1, 1)
+        self.cell_8_8 = QtWidgets.QLineEdit(parent=self.majCell_22)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cell_8_8.sizePolicy().hasHeightForWidth())
+        self.cell_8_8.setSizePolicy(sizePolicy)
+        self.cell_8_8.setMinimumSize(QtCore.QSize(40, 40))
+        self.cell_8_8.setMaximumSize(QtCore.QSize(40, 40))
+        self.cell_8_8.setObjectName("cell_8_8")
+        self.majCell_8.addWidget(self.cell_8_8, 2, 2, 1, 1)
+        self.boardLayout.addWidget(self.majCell_22, 2, 2, 1, 1)
+        self.verticalLayout_2.addWidget(self.boardFrame)
+        spacerItem2 = QtWidgets.QSpacerItem(17, 21, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem2)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label = QtWidgets.QLabel(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setObjectName("label")
+        self.horizontalLayout_2.addWidget(self.label)
+        self.difficultyComboBox = QtWidgets.QComboBox(parent=self.centralwidget)
+        self.difficultyComboBox.setObjectName("difficultyComboBox")
+        self.difficultyComboBox.addItem("")
+        self.difficultyComboBox.addItem("")
+        self.difficultyComboBox.addItem("")
+        self.horizontalLayout_2.addWidget(self.difficultyComboBox)
+        self.newGameButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.newGameButton.setObjectName("newGameButton")
+        self.horizontalLayout_2.addWidget(self.newGameButton)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.hintButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.hintButton.setEnabled(False)
+        self.hintButton.setObjectName("hintButton")
+        self.horizontalLayout.addWidget(self.hintButton)
+        self.checkNumbersButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.checkNumbersButton.setEnabled(False)
+        self.checkNumbersButton.setObjectName("checkNumbersButton")
+        self.horizontalLayout.addWidget(self.checkNumbersButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_2)
+        spacerItem3 = QtWidgets.QSpacerItem(34, 17, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem3)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Sudoku Game"))
+        self.label.setText(_translate("MainWindow", "Difficulty: "))
+        self.difficultyComboBox.setItemText(0, _translate("MainWindow", "Easy"))
+        self.difficultyComboBox.setItemText(1, _translate("MainWindow", "Medium"))
+        self.difficultyComboBox.setItemText(2, _translate("MainWindow", "Hard"))
+        self.newGameButton.setText(_translate("MainWindow", "New game"))
+        self.hintButton.setText(_translate("MainWindow", "Hint"))
+        self.checkNumbersButton.setText(_translate("MainWindow", "Check numbers"))
@@ -0,0 +1,79 @@
+"""Tests for the solver and the generator of the sudoku puzzles."""
+
+import pytest
+
+from pyqt_sudoku.sudoku_solver import generate_puzzle, solve_sudoku
+
+# Puzzle with a unique solution, flattened with '0' for the empty cells.
+UNIQUE_PUZZLE = [
+    int(value)
+    for value in (
+        "530070000"
+        "600195000"
+        "098000060"
+        "800060003"
+        "400803001"
+        "700020006"
+        "060000280"
+        "000419005"
+        "000080079"
+    )
+]
+UNIQUE_SOLUTION = [
+    int(value)
+    for value in (
+        "534678912"
+        "672195348"
+        "198342567"
+        "859761423"
+        "426853791"
+        "713924856"
+        "961537284"
+        "287419635"
+        "345286179"
+    )
+]
+
+
+def test_solve_unique_puzzle():
+    """A puzzle with one solution is solved and reported as unique."""
+    solution, is_unique = solve_sudoku(UNIQUE_PUZZLE)
+    assert list(solution) == UNIQUE_SOLUTION
+    assert is_unique
+
+
+def test_solve_empty_board():
+    """The empty board is solvable, but its solution is not unique."""
+    solution, is_unique = solve_sudoku([0] * 81)
+    assert solution is not None
+    assert not is_unique
+
+
+@pytest.mark.parametrize(
+    "duplicated_idx",
+    [
+        pytest.param(8, id="row"),
+        pytest.param(72, id="column"),
+        pytest.param(20, id="box"),
+    ],
+)
+def test_solve_board_with_duplicate(duplicated_idx):
+    """A value repeated within a row, column or box makes the board invalid."""
+    board = [0] * 81
+    board[0] = 5
+    board[duplicated_idx] = 5
+    assert solve_sudoku(board) == (None, False)
+
+
+@pytest.mark.parametrize("difficulty_level", [0.3, 0.45, 0.6])
+def test_generate_puzzle(difficulty_level):
+    """Generated puzzles have the requested empty cells and a unique solution."""
+    initial_board, solved_board = generate_puzzle(difficulty_level)
+    assert list(initial_board).count(0) == int(difficulty_level * 81)
+    assert all(
+        value in (0, solved_value)
+        for value, solved_value in zip(initial_board, solved_board)
+    )
+    solution, is_unique = solve_sudoku(initial_board)
+    assert is_unique
+    assert solution == solved_board